@@ -1,13 +1,14 @@
 """bw_projects."""
 from .config import Configuration
 from .core import ProjectsManager
-from .errors import BWProjectsException, ProjectExistsError
+from .errors import BWProjectsException, NoActiveProjectError, ProjectExistsError
 from .model import Project
 
 __all__ = (
     "__version__",
     "BWProjectsException",
     "Configuration",
+    "NoActiveProjectError",
     "Project",
     "ProjectExistsError",
     "ProjectsManager",
@@ -27,5 +27,5 @@ class Configuration:
 
         self.dir_base_data = Path(platformdirs.user_data_dir(app_name, app_author))
         self.dir_base_logs = Path(platformdirs.user_log_dir(app_name, app_author))
-        self.dir_output = dir_output
+        self.dir_output = Path(dir_output)
         self.dirs_basic = dirs_basic
@@ -1,6 +1,7 @@
 """Core functionalities for bw_projects."""
 import os
 from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Dict, List, NoReturn
 
@@ -8,7 +9,7 @@ from peewee import DoesNotExist
 from slugify import slugify
 
 from .config import Configuration
-from .errors import ProjectExistsError
+from .errors import NoActiveProjectError, ProjectExistsError
 from .helpers import DatabaseHelper, FileHelper
 from .model import Project
 
@@ -23,7 +24,7 @@ class ProjectsManager(Iterable):
         database_name: str = "projects.db",
         output_dir_name: str = None,
         max_repr_len: int = 25,
-        config: Configuration = Configuration(),
+        config: Configuration = None,
         callbacks_activate_project: List[
             Callable[["ProjectsManager", str, Dict[str, str], str], NoReturn]
         ] = None,
@@ -37,6 +38,8 @@ class ProjectsManager(Iterable):
             Callable[["ProjectsManager", str, Dict[str, str], str], NoReturn]
         ] = None,
     ) -> None:
+        if config is None:
+            config = Configuration()
         if callbacks_activate_project is None:
             callbacks_activate_project = []
         if callbacks_create_project is None:
@@ -55,47 +58,66 @@ class ProjectsManager(Iterable):
         self.callbacks_delete_project = callbacks_delete_project
         self.callbacks_copy_project = callbacks_copy_project
         self._active_project: Project = None
-        DatabaseHelper.init_db(self.file_helper.dir_base_data / database_name)
+        self._data_dir: Path = None
+        self._logs_dir: Path = None
+        self._database_path = str(self.file_helper.dir_base_data / database_name)
 
     def __iter__(self):
+        self._init_db()
         for project in DatabaseHelper.get_projects():
             yield project
 
     def __contains__(self, name: str) -> bool:
+        self._init_db()
         return DatabaseHelper.project_exists(name)
 
     def __len__(self) -> int:
+        self._init_db()
         return DatabaseHelper.get_projects_count()
 
     def __repr__(self) -> str:
-        projects = sorted([project.name for project in self])[: self.max_repr_len]
+        self._init_db()
+        projects = DatabaseHelper.get_project_names(self.max_repr_len)
         projects_fmt = "".join([f"\n\t{project}" for project in projects])
+        projects_count = len(self)
         repr_str = (
-            f"bw_projects manager with {len(self)} projects, including:{projects_fmt}"
+            f"bw_projects manager with {projects_count} projects, "
+            f"including:{projects_fmt}"
         )
-        if len(self) > self.max_repr_len:
+        if projects_count > self.max_repr_len:
             repr_str += (
                 "\n\t...\nTo get full list of projects, use `list(ProjectsManager)`."
             )
         return repr_str
 
+    def _init_db(self) -> None:
+        """Binds the shared projects database to this manager's file if another
+        manager has bound it elsewhere."""
+        if DatabaseHelper.get_database_path() != self._database_path:
+            DatabaseHelper.init_db(self._database_path)
+
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_clean_directory_name(name: str) -> str:
         """Changes project name to a file-friendly name."""
         return slugify(name)
 
     @property
-    def data_dir(self) -> str:
+    def data_dir(self) -> Path:
         """Returns the data directory for active project."""
-        return self.file_helper.dir_base_data / self.active_project.name
+        if self._active_project is None:
+            raise NoActiveProjectError
+        return self._data_dir
 
     @property
-    def logs_dir(self) -> str:
+    def logs_dir(self) -> Path:
         """Returns the logs directory for active project."""
-        return self.file_helper.dir_base_logs / self.active_project.name
+        if self._active_project is None:
+            raise NoActiveProjectError
+        return self._logs_dir
 
     @property
-    def output_dir(self) -> str:
+    def output_dir(self) -> Path:
         """Returns the output directory for active project."""
         return self.file_helper.dir_output
 
@@ -107,7 +129,10 @@ class ProjectsManager(Iterable):
     def activate_project(self, name: str) -> None:
         """Activates the project with the given name."""
         project_name = ProjectsManager.get_clean_directory_name(name)
+        self._init_db()
         self._active_project = DatabaseHelper.get_project(project_name)
+        self._data_dir = self.file_helper.get_project_data_directory(project_name)
+        self._logs_dir = self.file_helper.get_project_logs_directory(project_name)
         for callback in self.callbacks_activate_project:
             callback(
                 self,
@@ -128,17 +153,17 @@ class ProjectsManager(Iterable):
             attributes = {}
 
         project_name = ProjectsManager.get_clean_directory_name(name)
-        if not DatabaseHelper.project_exists(project_name):
+        self._init_db()
+        project = DatabaseHelper.find_project(project_name)
+        if project is None:
             data_path, logs_path = self.file_helper.create_project_directory(
                 project_name, exist_ok
             )
             project = DatabaseHelper.create_project(
                 project_name, data_path, logs_path, attributes
             )
-        else:
-            if not exist_ok:
-                raise ProjectExistsError(project_name)
-            project = DatabaseHelper.get_project(project_name)
+        elif not exist_ok:
+            raise ProjectExistsError(project_name)
 
         if activate:
             self.activate_project(project_name)
@@ -151,16 +176,20 @@ class ProjectsManager(Iterable):
     ) -> None:
         """Deletes the project with the given name."""
         project_name = ProjectsManager.get_clean_directory_name(name)
-        if not DatabaseHelper.project_exists(project_name):
-            if not not_exist_ok:
-                raise DoesNotExist
-            return
-        project = DatabaseHelper.get_project(project_name)
-        DatabaseHelper.delete_project(project_name)
+        self._init_db()
+        with DatabaseHelper.atomic():
+            project = DatabaseHelper.find_project(project_name)
+            if project is None:
+                if not not_exist_ok:
+                    raise DoesNotExist
+                return
+            DatabaseHelper.delete_project(project_name)
         if delete_dir:
             self.file_helper.delete_project_directory(project_name)
         if self._active_project.name == project_name:
             self._active_project = None
+            self._data_dir = None
+            self._logs_dir = None
         for callback in self.callbacks_delete_project:
             callback(self, project_name, project.attributes, project.dir_data)
 
@@ -171,14 +200,15 @@ class ProjectsManager(Iterable):
         If ``switch``, switches to new project. Defaults to ``True``."""
 
         project_name = ProjectsManager.get_clean_directory_name(new_name)
-        if project_name in self:
+        self._init_db()
+        if DatabaseHelper.find_project(project_name) is not None:
             raise ProjectExistsError(project_name)
 
         data_path, logs_path = self.file_helper.copy_project_directory(
             self.active_project.name, project_name, dirs_exist_ok
         )
         project = DatabaseHelper.copy_project(
-            self.active_project.name, project_name, data_path, logs_path
+            self.active_project, project_name, data_path, logs_path
         )
         if switch:
             self.activate_project(project_name)
@@ -7,3 +7,7 @@ class BWProjectsException(BaseException):
 
 class ProjectExistsError(BWProjectsException):
     """A project with this name already exists."""
+
+
+class NoActiveProjectError(BWProjectsException, AttributeError):
+    """No project is active."""
@@ -1,11 +1,60 @@
 """Helper classes for bw_projects."""
+import errno
+import os
+import platform
 import shutil
+import stat
+import sys
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import ContextManager, Dict, Tuple
 
 from .config import Configuration
 from .model import SQLITE_DATABASE, Project
 
+SUPPORTS_DIR_FD = (
+    hasattr(os, "O_DIRECTORY")
+    and os.mkdir in os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+# Architectures encoding ioctl numbers with the generic ``_IOW`` layout, on which
+# ``FICLONE`` is 0x40049409. Others (e.g. ppc, mips, sparc) use different bits.
+_GENERIC_IOCTL_MACHINES = ("x86_64", "i686", "aarch64", "armv7l", "riscv64", "s390x")
+
+if sys.platform.startswith("linux"):
+    import fcntl
+
+    FICLONE = getattr(fcntl, "FICLONE", None)
+    if FICLONE is None and platform.machine() in _GENERIC_IOCTL_MACHINES:
+        FICLONE = 0x40049409
+else:  # pragma: no cover
+    fcntl = None
+    FICLONE = None
+
+
+class _FileCloner:
+    """Copy function for ``shutil.copytree`` sharing data blocks between the source
+    and the copy if the filesystem supports it (e.g. btrfs or XFS).
+
+    Cloning is only tried for regular files and is given up for the rest of the
+    copy after the first failure. Otherwise falls back to ``shutil.copy2``, which
+    copies in-kernel where possible."""
+
+    def __init__(self) -> None:
+        self.clone = FICLONE is not None
+
+    def __call__(self, src: str, dst: str) -> str:
+        if self.clone and stat.S_ISREG(os.stat(src).st_mode):
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            except OSError:
+                self.clone = False
+            else:
+                shutil.copystat(src, dst)
+                return dst
+        return shutil.copy2(src, dst)
+
 
 class DatabaseHelper:
     """Helper class for database operations."""
@@ -16,6 +65,16 @@ class DatabaseHelper:
         SQLITE_DATABASE.init(database_name)
         SQLITE_DATABASE.create_tables([Project])
 
+    @staticmethod
+    def get_database_path() -> str:
+        """Returns the file the database is currently bound to."""
+        return SQLITE_DATABASE.database
+
+    @staticmethod
+    def atomic() -> ContextManager:
+        """Returns a context manager running its statements in one transaction."""
+        return SQLITE_DATABASE.atomic()
+
     @staticmethod
     def create_project(
         name: str, data_path: str, logs_path: str, attributes: Dict
@@ -32,10 +91,9 @@ class DatabaseHelper:
 
     @staticmethod
     def copy_project(
-        name: str, new_name: str, data_path: str, logs_path: str
+        project: Project, new_name: str, data_path: str, logs_path: str
     ) -> Project:
-        """Copies the project with the given name."""
-        project = Project.get(Project.name == name)
+        """Copies the given project."""
         return Project.create(
             name=new_name,
             dir_data=data_path,
@@ -48,11 +106,25 @@ class DatabaseHelper:
         """Returns the project with the given name."""
         return Project.get(Project.name == name)
 
+    @staticmethod
+    def find_project(name: str) -> Project:
+        """Returns the project with the given name, or ``None`` if missing."""
+        return Project.get_or_none(Project.name == name)
+
     @staticmethod
     def get_projects() -> list[Project]:
         """Returns a list of all projects."""
         return Project.select()
 
+    @staticmethod
+    def get_project_names(limit: int = None) -> list[str]:
+        """Returns the names of at most ``limit`` projects sorted by name.
+
+        Rows are fetched as tuples, skipping the construction of ``Project``
+        instances."""
+        query = Project.select(Project.name).order_by(Project.name).limit(limit)
+        return [name for (name,) in query.tuples()]
+
     @staticmethod
     def get_projects_count() -> int:
         """Returns the number of projects."""
@@ -61,7 +133,7 @@ class DatabaseHelper:
     @staticmethod
     def project_exists(name: str) -> bool:
         """Checks if a project with the given name exists."""
-        return Project.select().where(Project.name == name).count() > 0
+        return Project.select(Project.id).where(Project.name == name).exists()
 
 
 class FileHelper:
@@ -103,13 +175,45 @@ class FileHelper:
         """Returns the directory for the given project."""
         return self.dir_base_logs / name
 
+    def create_basic_directories(self, project_data_dir: Path, exist_ok: bool) -> None:
+        """Creates the missing basic directories for the given project directory.
+
+        Where supported, the project directory is opened once and the basic
+        directories are listed and created relative to it, so its path is only
+        resolved once."""
+        dir_fd = None
+        if SUPPORTS_DIR_FD:
+            dir_fd = os.open(project_data_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with os.scandir(project_data_dir if dir_fd is None else dir_fd) as entries:
+                existing = {entry.name: entry.is_dir() for entry in entries}
+            for dir_basic in self.dirs_basic:
+                is_dir = existing.get(dir_basic)
+                if is_dir:
+                    continue
+                full_dir_basic = project_data_dir / dir_basic
+                if is_dir is not None:
+                    raise FileExistsError(
+                        errno.EEXIST, os.strerror(errno.EEXIST), str(full_dir_basic)
+                    )
+                if dir_fd is not None and os.sep not in dir_basic:
+                    try:
+                        os.mkdir(dir_basic, dir_fd=dir_fd)
+                    except FileExistsError:
+                        mode = os.stat(dir_basic, dir_fd=dir_fd).st_mode
+                        if not exist_ok or not stat.S_ISDIR(mode):
+                            raise
+                else:
+                    full_dir_basic.mkdir(parents=True, exist_ok=exist_ok)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
     def create_project_directory(self, name: str, exist_ok: bool) -> Tuple[str, str]:
         """Creates a directory for the given project."""
         project_data_dir = self.get_project_data_directory(name)
         project_data_dir.mkdir(parents=True, exist_ok=exist_ok)
-        for dir_basic in self.dirs_basic:
-            full_dir_basic = project_data_dir / dir_basic
-            full_dir_basic.mkdir(parents=True, exist_ok=exist_ok)
+        self.create_basic_directories(project_data_dir, exist_ok)
 
         project_logs_dir = self.get_project_logs_directory(name)
         project_logs_dir.mkdir(parents=True, exist_ok=exist_ok)
@@ -130,11 +234,13 @@ class FileHelper:
         shutil.copytree(
             self.get_project_data_directory(name),
             new_data_path,
+            copy_function=_FileCloner(),
             dirs_exist_ok=dirs_exist_ok,
         )
         shutil.copytree(
             self.get_project_logs_directory(name),
             new_logs_path,
+            copy_function=_FileCloner(),
             dirs_exist_ok=dirs_exist_ok,
         )
         return new_data_path, new_logs_path
@@ -5,7 +5,14 @@ from typing import Dict
 from peewee import Model, SqliteDatabase, TextField
 from playhouse.sqlite_ext import JSONField
 
-SQLITE_DATABASE: SqliteDatabase = SqliteDatabase(None)
+SQLITE_DATABASE: SqliteDatabase = SqliteDatabase(
+    None,
+    pragmas={
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "temp_store": "memory",
+    },
+)
 
 
 def _attributes_dumps(value: Dict[str, str]) -> str:
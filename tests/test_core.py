@@ -1,13 +1,18 @@
 """Test cases for the __core__ module."""
+import os
+import shutil
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, Tuple
 
 import pytest
 from peewee import DoesNotExist
 
+from bw_projects.config import Configuration
 from bw_projects.core import ProjectsManager
-from bw_projects.errors import ProjectExistsError
+from bw_projects.errors import NoActiveProjectError, ProjectExistsError
 from bw_projects.helpers import DatabaseHelper
+from bw_projects.model import SQLITE_DATABASE
 
 
 @pytest.fixture(name="base_dirs")
@@ -35,6 +40,14 @@ def test_itr_projects(projects_manager: ProjectsManager) -> None:
     assert [project.name for project in projects_manager] == projects
 
 
+def test_project_names(projects_manager: ProjectsManager) -> None:
+    """Tests listing sorted project names."""
+    for project in ["foo", "bar", "baz"]:
+        projects_manager.create_project(project)
+    assert DatabaseHelper.get_project_names() == ["bar", "baz", "foo"]
+    assert DatabaseHelper.get_project_names(2) == ["bar", "baz"]
+
+
 def test_contains_project(projects_manager: ProjectsManager) -> None:
     """Tests if projects_manager contains a project."""
     assert "foo" not in projects_manager  # No projects created yet.
@@ -43,6 +56,47 @@ def test_contains_project(projects_manager: ProjectsManager) -> None:
     assert "foo" in projects_manager
 
 
+def test_contains_project_after_copy_and_delete(
+    projects_manager: ProjectsManager,
+) -> None:
+    """Tests membership after copying and deleting projects."""
+    projects_manager.create_project("foo", activate=True)
+    projects_manager.copy_project("bar", switch=False)
+    assert "bar" in projects_manager
+
+    projects_manager.delete_project("foo")
+    assert "foo" not in projects_manager
+
+
+def test_multiple_managers_same_location(base_dirs) -> None:
+    """Tests managers sharing one database seeing each other's projects."""
+    manager_a = ProjectsManager(base_dirs[0], base_dirs[1])
+    manager_b = ProjectsManager(base_dirs[0], base_dirs[1])
+    manager_a.create_project("foo", activate=True)
+    assert "bar" not in manager_a
+    manager_b.create_project("bar")
+    assert "bar" in manager_a
+    assert len(manager_a) == 2
+    assert repr(manager_a).startswith("bw_projects manager with 2 projects")
+    with pytest.raises(ProjectExistsError):
+        manager_a.copy_project("bar")
+
+
+def test_len_projects(projects_manager: ProjectsManager) -> None:
+    """Tests counting projects across creating and deleting."""
+    assert len(projects_manager) == 0  # No projects created yet.
+
+    projects_manager.create_project("foo", activate=True)
+    projects_manager.create_project("bar")
+    assert len(projects_manager) == 2
+
+    projects_manager.copy_project("baz", switch=False)
+    assert len(projects_manager) == 3
+
+    projects_manager.delete_project("bar")
+    assert len(projects_manager) == 2
+
+
 def test_repr(projects_manager: ProjectsManager) -> None:
     """Tests representation of projects_manager."""
     assert (
@@ -74,6 +128,47 @@ def test_base_dirs(base_dirs) -> None:
     assert projects_manager.output_dir == Path.home()
 
 
+def test_output_dir_from_config(base_dirs, tmpdir) -> None:
+    """Tests output directory given as a string in the configuration."""
+    dir_output = str(tmpdir.join("output"))
+    projects_manager = ProjectsManager(
+        base_dirs[0], base_dirs[1], config=Configuration(dir_output=dir_output)
+    )
+    assert projects_manager.output_dir == Path(dir_output)
+    assert projects_manager.output_dir.is_dir()
+
+
+def test_database_opened_on_first_use(base_dirs) -> None:
+    """Tests the projects database is not created before it is needed."""
+    data_dir = base_dirs[0]
+    projects_manager = ProjectsManager(data_dir, base_dirs[1])
+    assert data_dir.join("projects.db").check(exists=False)
+    assert len(projects_manager) == 0
+    assert data_dir.join("projects.db").check(file=True)
+
+
+def test_multiple_managers_different_location(tmpdir) -> None:
+    """Tests managers with different locations each querying their own database."""
+    manager_a = ProjectsManager(tmpdir / "a" / "data", tmpdir / "a" / "logs")
+    manager_b = ProjectsManager(tmpdir / "b" / "data", tmpdir / "b" / "logs")
+    manager_a.create_project("foo", activate=True)
+    assert "foo" in manager_a
+    manager_b.create_project("bar")
+    manager_a.create_project("baz")
+    manager_a.copy_project("qux", switch=False)
+    assert [project.name for project in manager_a] == ["foo", "baz", "qux"]
+    assert [project.name for project in manager_b] == ["bar"]
+    assert "bar" not in manager_a
+    assert len(manager_b) == 1
+
+
+def test_database_pragmas(projects_manager: ProjectsManager) -> None:
+    """Tests the projects database running in WAL mode."""
+    projects_manager.create_project("foo")
+    assert SQLITE_DATABASE.execute_sql("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert SQLITE_DATABASE.execute_sql("PRAGMA synchronous").fetchone()[0] == 1
+
+
 def test_activate_project_does_not_exist(projects_manager: ProjectsManager) -> None:
     """Tests activating non-existent project."""
     with pytest.raises(DoesNotExist):
@@ -172,6 +267,66 @@ def test_create_project_existing_okay_no_activate(
     assert projects_manager.active_project is None
 
 
+def test_create_project_existing_directory_exist_ok(base_dirs) -> None:
+    """Tests creating a project over a partially populated directory."""
+    data_dir = base_dirs[0]
+    data_dir.mkdir("foo").mkdir("lci").join("keep.txt").write("bar")
+    projects_manager = ProjectsManager(data_dir, base_dirs[1])
+    projects_manager.create_project("foo", exist_ok=True)
+    for dir_basic in ("backups", "intermediate", "lci", "processed"):
+        assert data_dir.join("foo", dir_basic).check(dir=True)
+    assert data_dir.join("foo", "lci", "keep.txt").read() == "bar"
+
+
+def test_create_basic_directories_created_concurrently(
+    projects_manager: ProjectsManager, monkeypatch
+) -> None:
+    """Tests basic directories appearing between listing and creating them."""
+    project_data_dir = projects_manager.file_helper.get_project_data_directory("foo")
+    project_data_dir.mkdir()
+    scandir = os.scandir
+
+    def _scandir(path):
+        with scandir(path) as entries:
+            entries = list(entries)
+        (project_data_dir / "lci").mkdir()
+        return nullcontext(entries)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    projects_manager.file_helper.create_basic_directories(project_data_dir, True)
+    assert (project_data_dir / "lci").is_dir()
+    assert (project_data_dir / "processed").is_dir()
+
+
+def test_create_basic_directories_file_created_concurrently(
+    projects_manager: ProjectsManager, monkeypatch
+) -> None:
+    """Tests a file named as a basic directory appearing before creating it."""
+    project_data_dir = projects_manager.file_helper.get_project_data_directory("foo")
+    project_data_dir.mkdir()
+    scandir = os.scandir
+
+    def _scandir(path):
+        with scandir(path) as entries:
+            entries = list(entries)
+        (project_data_dir / "lci").write_text("bar")
+        return nullcontext(entries)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    with pytest.raises(FileExistsError):
+        projects_manager.file_helper.create_basic_directories(project_data_dir, True)
+
+
+def test_create_project_basic_directory_is_file(base_dirs) -> None:
+    """Tests creating a project where a basic directory name is taken by a file."""
+    data_dir = base_dirs[0]
+    data_dir.mkdir("foo").join("lci").write("bar")
+    projects_manager = ProjectsManager(data_dir, base_dirs[1])
+    with pytest.raises(FileExistsError):
+        projects_manager.create_project("foo", exist_ok=True)
+    assert data_dir.join("foo", "lci").check(file=True)
+
+
 def test_delete_project_does_not_exist_not_exist_not_okay(
     projects_manager: ProjectsManager,
 ) -> None:
@@ -214,6 +369,10 @@ def test_delete_project_existing_and_active_with_callbacks(base_dirs, capsys) ->
     projects_manager.delete_project(project_name)
     assert not DatabaseHelper.project_exists(project_name)
     assert projects_manager.active_project is None
+    with pytest.raises(NoActiveProjectError):
+        projects_manager.data_dir  # pylint: disable=pointless-statement
+    with pytest.raises(NoActiveProjectError):
+        projects_manager.logs_dir  # pylint: disable=pointless-statement
     assert data_dir.join(project_name).check(dir=False)
     assert logs_dir.join(project_name).check(dir=False)
 
@@ -280,6 +439,23 @@ def test_copy_project_not_existing_dirs_exist_ok_and_switch_with_callbacks(
     assert out == f"{callback_copy_project_out}\n"
 
 
+def test_copy_project_copies_files(projects_manager: ProjectsManager) -> None:
+    """Tests copying project files to the new project."""
+    projects_manager.create_project("foo", activate=True)
+    (projects_manager.data_dir / "lci" / "baz.txt").write_text("qux")
+    projects_manager.copy_project("bar")
+    assert (projects_manager.data_dir / "lci" / "baz.txt").read_text() == "qux"
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Needs named pipes")
+def test_copy_project_special_file(projects_manager: ProjectsManager) -> None:
+    """Tests copying a project containing a named pipe fails instead of blocking."""
+    projects_manager.create_project("foo", activate=True)
+    os.mkfifo(projects_manager.data_dir / "lci" / "pipe")
+    with pytest.raises(shutil.Error):
+        projects_manager.copy_project("bar")
+
+
 def test_copy_project_existing_dirs_exist_ok_and_switch(
     projects_manager: ProjectsManager,
 ) -> None:
@@ -303,3 +479,17 @@ def test_request_directory(projects_manager: ProjectsManager) -> None:
         projects_manager.request_directory(dirname)
         == projects_manager.data_dir / dirname
     )
+
+
+def test_project_dirs_no_active_project(projects_manager: ProjectsManager) -> None:
+    """Tests project directories being absent attributes without an active project."""
+    assert not hasattr(projects_manager, "data_dir")
+    assert getattr(projects_manager, "logs_dir", None) is None
+
+
+def test_request_directory_no_active_project(
+    projects_manager: ProjectsManager,
+) -> None:
+    """Tests requesting a directory without an active project."""
+    with pytest.raises(NoActiveProjectError):
+        projects_manager.request_directory("bar")
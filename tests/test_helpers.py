@@ -0,0 +1,47 @@
+"""Test cases for the __helpers__ module."""
+import os
+import sys
+
+import pytest
+
+from bw_projects import helpers
+
+
+@pytest.fixture(name="cloner")
+def _cloner(monkeypatch) -> helpers._FileCloner:
+    """Returns a _FileCloner with the FICLONE ioctl number set."""
+    monkeypatch.setattr(helpers, "FICLONE", 0x40049409)
+    return helpers._FileCloner()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+def test_file_cloner_clones(cloner, monkeypatch, tmp_path) -> None:
+    """Tests cloning a file copies its metadata and returns the destination."""
+    requests = []
+    monkeypatch.setattr(
+        helpers.fcntl, "ioctl", lambda fd, request, arg: requests.append(request)
+    )
+    src = tmp_path / "src"
+    src.write_text("foo")
+    os.utime(src, (0, 0))
+    dst = str(tmp_path / "dst")
+    assert cloner(str(src), dst) == dst
+    assert requests == [0x40049409]
+    assert os.stat(dst).st_mtime == 0
+    assert cloner.clone
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+def test_file_cloner_falls_back(cloner, monkeypatch, tmp_path) -> None:
+    """Tests falling back to copying, and not cloning again, if cloning fails."""
+
+    def _ioctl(fd, request, arg):
+        raise OSError
+
+    monkeypatch.setattr(helpers.fcntl, "ioctl", _ioctl)
+    src = tmp_path / "src"
+    src.write_text("foo")
+    dst = str(tmp_path / "dst")
+    assert cloner(str(src), dst) == dst
+    assert (tmp_path / "dst").read_text() == "foo"
+    assert not cloner.clone